@@ -25,6 +25,11 @@ COUNTIES = [
     # }
 ]
 
+# Precompute the human-readable county label once - it's rebuilt per alert
+# in logs, the interactive preview, and notifications otherwise
+for _county in COUNTIES:
+    _county["display"] = f"{_county['name']} County, {_county['state']}"
+
 # Notification settings
 ENABLE_TEXT_NOTIFICATIONS = False
 ENABLE_DISCORD_NOTIFICATIONS = True
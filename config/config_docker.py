@@ -3,6 +3,7 @@ Configuration for the eBird Rare Bird Alert monitor.
 This file supports environment variable overrides for easy Docker deployment.
 """
 import os
+from functools import lru_cache
 from typing import Dict, List, Any
 
 # Counties to monitor - can be extended with more counties
@@ -28,12 +29,23 @@ COUNTIES = [
     # }
 ]
 
-# Load environment variables or use defaults
+# Precompute the human-readable county label once - it's rebuilt per alert
+# in logs, the interactive preview, and notifications otherwise
+for _county in COUNTIES:
+    _county["display"] = f"{_county['name']} County, {_county['state']}"
+
+# Truthy values as a frozenset - O(1) hashed lookup instead of a tuple scan
+_TRUTHY = frozenset(('true', 't', 'yes', 'y', '1'))
+
+# Load environment variables or use defaults - memoized since the
+# environment doesn't change after container start
+@lru_cache(maxsize=None)
 def get_env_bool(name: str, default: bool) -> bool:
     """Get boolean environment variable"""
     val = os.environ.get(name, str(default).lower())
-    return val.lower() in ('true', 't', 'yes', 'y', '1')
+    return val.lower() in _TRUTHY
 
+@lru_cache(maxsize=None)
 def get_env_int(name: str, default: int) -> int:
     """Get integer environment variable"""
     try:
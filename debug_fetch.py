@@ -11,9 +11,15 @@ import requests
 # Add parent directory to path so we can import our modules
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
 
-from src.ebird_fetcher import EBirdFetcher
 from config.config import COUNTIES
 
+# Shared session so repeated debug fetches reuse one connection
+session = requests.Session()
+session.headers.update({
+    'User-Agent': 'rba-notify/1.0',
+    'Accept-Encoding': 'gzip, deflate'
+})
+
 def display_alert(alert, index=None):
     """Display a single alert in a formatted way"""
     prefix = f"[{index}] " if index is not None else ""
@@ -30,7 +36,7 @@ def display_alert(alert, index=None):
 
 def save_html_report(alerts, county, filename):
     """Save alerts as an HTML report for better visualization"""
-    html = f"""
+    header = f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -59,33 +65,35 @@ def save_html_report(alerts, county, filename):
             Data fetched on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         </div>
     """
-    
-    for alert in alerts:
-        scientific_html = f"<div class='scientific'>{alert['scientificName']}</div>" if alert['scientificName'] else ""
-        html += f"""
+
+    # Stream each block straight to the file rather than growing one big
+    # string with += per alert
+    with open(filename, 'w', encoding='utf-8') as f:
+        f.write(header)
+
+        for alert in alerts:
+            scientific_html = f"<div class='scientific'>{alert['scientificName']}</div>" if alert['scientificName'] else ""
+            f.write(f"""
         <div class="alert">
             <div class="species">{alert['species']}</div>
             {scientific_html}
             <div class="details">
-                <strong>Count:</strong> {alert['count']} • 
-                <strong>Date:</strong> {alert['date']} • 
-                <strong>Location:</strong> {alert['location']} • 
+                <strong>Count:</strong> {alert['count']} •
+                <strong>Date:</strong> {alert['date']} •
+                <strong>Location:</strong> {alert['location']} •
                 <strong>Observer:</strong> {alert['observer']}
             </div>
             <div class="url">
                 <a href="{alert['checklistUrl']}" target="_blank">View on eBird</a>
             </div>
         </div>
-        """
-    
-    html += """
+        """)
+
+        f.write("""
     </body>
     </html>
-    """
-    
-    with open(filename, 'w', encoding='utf-8') as f:
-        f.write(html)
-    
+    """)
+
     print(f"\nHTML report saved to {filename}")
     return filename
 
@@ -98,7 +106,7 @@ def save_raw_html(url, filename):
         filename: File to save the HTML to
     """
     try:
-        response = requests.get(url)
+        response = session.get(url, timeout=10)
         response.raise_for_status()
         
         with open(filename, 'w', encoding='utf-8') as f:
@@ -123,10 +131,10 @@ def extract_html_sample(url, alert_class='.Observation', output_file=None):
         from bs4 import BeautifulSoup
         
         print(f"Fetching page to extract HTML structure...")
-        response = requests.get(url)
+        response = session.get(url, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Find the first observation card
         obs_card = soup.select_one(alert_class)
@@ -163,10 +171,10 @@ def debug_reporter_extraction(url):
     try:
         from bs4 import BeautifulSoup
         print("Fetching page to debug reporter extraction...")
-        response = requests.get(url)
+        response = session.get(url, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         obs_cards = soup.select('.Observation')
         
         if not obs_cards:
@@ -257,7 +265,9 @@ def main():
     os.makedirs(debug_dir, exist_ok=True)
     debug_file = os.path.join(debug_dir, 'debug_temp.json')
     
-    # Initialize the fetcher with a proper file path
+    # Initialize the fetcher with a proper file path - imported here so the
+    # --debug-reporter / --save-raw only paths skip the fetcher's import cost
+    from src.ebird_fetcher import EBirdFetcher
     fetcher = EBirdFetcher(debug_file)
     
     try:
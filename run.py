@@ -4,23 +4,31 @@ Startup script for eBird Rare Bird Alert Monitor
 import logging
 import sys
 import os
-from src.monitor import main
+from logging.handlers import MemoryHandler, RotatingFileHandler
 
 if __name__ == "__main__":
     try:
         # Ensure logs directory exists
         os.makedirs('logs', exist_ok=True)
-        
-        # Set up console logging
+
+        # Set up console logging; file records buffer in memory and flush
+        # in batches to a size-capped rotating file (ERROR and above flush
+        # immediately), while the console stays line-by-line
+        file_handler = RotatingFileHandler('logs/ebird-rba.log', maxBytes=5_000_000, backupCount=3)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
         logging.basicConfig(
             level=logging.INFO,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             handlers=[
-                logging.FileHandler('logs/ebird-rba.log'),
+                MemoryHandler(capacity=200, target=file_handler),
                 logging.StreamHandler(sys.stdout)
             ]
         )
-        
+
+        # Import after logging is configured - pulling in the monitor stack
+        # (requests, parsers, notifier SDKs) is the slow part of startup
+        from src.monitor import main
+
         # Start the monitor
         main()
     except Exception as e:
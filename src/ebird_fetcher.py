@@ -2,13 +2,30 @@
 Module to fetch and parse eBird rare bird alerts
 """
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import soupsieve as sv
 import json
 import os
 import logging
 import re
+import threading
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
+
+# orjson is a much faster C implementation - fall back to stdlib json if unavailable
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# selectolax's Lexbor engine builds the DOM in C without a Python object per
+# tag, parsing an order of magnitude faster than BeautifulSoup; fall back to
+# the BeautifulSoup path when it isn't installed
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 # Set up logging
 logging.basicConfig(
@@ -18,6 +35,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once at import rather than per observation card
+_COUNT_RE = re.compile(r'Number observed:\s*(.+)')
+
+# CSS selectors compiled once at import - BeautifulSoup would otherwise
+# re-run the soupsieve selector compiler on every select call
+_SEL_OBS = sv.compile('.Observation')
+_SEL_SPECIES = sv.compile('.Observation-species a')
+_SEL_HEADING_MAIN = sv.compile('.Heading-main')
+_SEL_HEADING_SUB = sv.compile('.Heading-sub')
+_SEL_CHECKLIST_LINK = sv.compile('.Observation-meta a[href*="/checklist/"]')
+_SEL_LOC = sv.compile('.Observation-meta a[href*="google.com/maps"]')
+_SEL_COUNT = sv.compile('.Observation-numberObserved')
+_SEL_VISIBLE_SPANS = sv.compile('span:not(.is-visuallyHidden)')
+_SEL_OBSERVER = sv.compile('.GridFlex--flex .GridFlex-cell.u-sizeFill span:not(.is-visuallyHidden)')
+
+# The observation cards all live inside <main>; everything after it is
+# footer/script/style bytes we never look at
+_BODY_SENTINEL = b'</main>'
+
+def _read_observation_html(response) -> bytes:
+    """
+    Read the response body in chunks, stopping at the closing </main> tag
+
+    Args:
+        response: A streaming requests.Response
+
+    Returns:
+        Page bytes up to and including </main> (or the full body if absent)
+    """
+    buf = bytearray()
+    for chunk in response.iter_content(chunk_size=16384):
+        # Start the search slightly before the new chunk in case the
+        # sentinel straddles a chunk boundary
+        start = max(0, len(buf) - len(_BODY_SENTINEL) + 1)
+        buf.extend(chunk)
+        idx = buf.find(_BODY_SENTINEL, start)
+        if idx != -1:
+            del buf[idx + len(_BODY_SENTINEL):]
+            response.close()
+            break
+    return bytes(buf)
+
 class EBirdFetcher:
     def __init__(self, data_storage_file: str):
         """
@@ -28,18 +87,50 @@ class EBirdFetcher:
         """
         self.data_storage_file = data_storage_file
         self.previous_alerts = self._load_previous_alerts()
+
+        # Counties may be checked from worker threads - serialize updates
+        # to previous_alerts and the storage file
+        self._lock = threading.Lock()
+
+        # Set when previous_alerts has unsaved changes; flush() writes them out
+        self._dirty = False
+
+        # mtime of the storage file as last seen by this process, used by
+        # reload_if_changed to detect external edits
+        self._storage_mtime = self._stat_storage()
+
+        # Reuse one session across fetches: keeps the TCP+TLS connection to
+        # ebird.org alive between polls and requests compressed responses
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'rba-notify/1.0',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # Conditional-GET state: last validators and parsed observations per
+        # county, so an HTTP 304 skips the download and parse entirely
+        self._etags: Dict[str, str] = {}
+        self._last_modified: Dict[str, str] = {}
+        self._last_obs: Dict[str, List[Dict[str, Any]]] = {}
     
-    def _load_previous_alerts(self) -> Dict[str, List[str]]:
+    def _load_previous_alerts(self) -> Dict[str, Set[str]]:
         """
         Load previously seen alerts from storage file
-        
+
         Returns:
-            Dictionary mapping county alert_id to list of observation IDs
+            Dictionary mapping county alert_id to set of observation IDs
         """
         if os.path.exists(self.data_storage_file):
             try:
-                with open(self.data_storage_file, 'r') as f:
-                    return json.load(f)
+                with open(self.data_storage_file, 'rb') as f:
+                    data = f.read()
+                loaded = orjson.loads(data) if orjson else json.loads(data)
+                # Stored as lists in JSON; sets give O(1) membership checks in memory
+                return {alert_id: set(ids) for alert_id, ids in loaded.items()}
             except Exception as e:
                 logger.error(f"Error loading previous alerts: {e}")
                 return {}
@@ -47,22 +138,89 @@ class EBirdFetcher:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.data_storage_file), exist_ok=True)
             return {}
-    
+
+    def _stat_storage(self):
+        """Return the storage file's mtime, or None if it doesn't exist"""
+        try:
+            return os.path.getmtime(self.data_storage_file)
+        except OSError:
+            return None
+
+    def reload_if_changed(self):
+        """
+        Re-read the storage file if it was modified outside this process
+
+        The in-memory dict is authoritative during normal operation; this
+        only reloads after external edits (e.g. manual cleanup of the JSON).
+        """
+        mtime = self._stat_storage()
+        with self._lock:
+            if mtime != self._storage_mtime:
+                logger.info("Storage file changed on disk - reloading previous alerts")
+                self.previous_alerts = self._load_previous_alerts()
+                self._storage_mtime = mtime
+                self._dirty = False
+
     def _save_previous_alerts(self):
         """Save the current alerts to the storage file"""
         try:
-            with open(self.data_storage_file, 'w') as f:
-                json.dump(self.previous_alerts, f)
+            # Sets aren't JSON-serializable - convert back to sorted lists
+            serializable = {alert_id: sorted(ids) for alert_id, ids in self.previous_alerts.items()}
+            if orjson:
+                data = orjson.dumps(serializable)
+            else:
+                data = json.dumps(serializable).encode('utf-8')
+            # Write to a temp file and rename so a crash mid-write can't
+            # leave a truncated/corrupt storage file behind
+            tmp_file = self.data_storage_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.data_storage_file)
+            self._storage_mtime = self._stat_storage()
         except Exception as e:
             logger.error(f"Error saving previous alerts: {e}")
     
-    def fetch_alerts(self, county: Dict[str, str]) -> List[Dict[str, Any]]:
+    def _extract_ids(self, soup) -> List[Any]:
+        """
+        Pair each observation card with its observation ID
+
+        Reading the ID is a single attribute lookup, so callers can diff IDs
+        against the seen set before paying for the full field extraction.
+
+        Args:
+            soup: Parsed alert page
+
+        Returns:
+            List of (obs_id, card) tuples
+        """
+        return [
+            (card.get('id', '').replace('obs-OBS', ''), card)
+            for card in _SEL_OBS.select(soup)
+        ]
+
+    def _extract_ids_lexbor(self, tree) -> List[Any]:
+        """
+        Lexbor counterpart of _extract_ids
+
+        Args:
+            tree: LexborHTMLParser tree for the alert page
+
+        Returns:
+            List of (obs_id, node) tuples
+        """
+        return [
+            ((card.attributes.get('id') or '').replace('obs-OBS', ''), card)
+            for card in tree.css('.Observation')
+        ]
+
+    def fetch_alerts(self, county: Dict[str, str], skip_ids: Set[str] = None) -> List[Dict[str, Any]]:
         """
         Fetch rare bird alerts for a specific county
-        
+
         Args:
             county: County information including alert URL
-            
+            skip_ids: Optional set of observation IDs to skip without parsing
+
         Returns:
             List of alert dictionaries with observation details
         """
@@ -71,173 +229,330 @@ class EBirdFetcher:
         
         try:
             logger.info(f"Fetching alerts for {county['name']} County, {county['state']}")
-            response = requests.get(url)
+
+            # Send the validators from the last fetch; on 304 the page is
+            # unchanged and we can return the cached observations directly
+            headers = {}
+            if alert_id in self._etags:
+                headers['If-None-Match'] = self._etags[alert_id]
+            if alert_id in self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified[alert_id]
+
+            response = self.session.get(url, headers=headers, timeout=10, stream=True)
+            if response.status_code == 304:
+                logger.info(f"Alerts unchanged for {county['name']} County (HTTP 304)")
+                response.close()
+                cached = self._last_obs.get(alert_id, [])
+                if skip_ids:
+                    cached = [obs for obs in cached if obs['id'] not in skip_ids]
+                return cached
             response.raise_for_status()
+
+            if 'ETag' in response.headers:
+                self._etags[alert_id] = response.headers['ETag']
+            if 'Last-Modified' in response.headers:
+                self._last_modified[alert_id] = response.headers['Last-Modified']
+
+            # Stream the body and stop at </main> so the footer is never
+            # downloaded; parse with Lexbor when available, else lxml via
+            # BeautifulSoup - passing bytes skips a redundant decode
+            content = _read_observation_html(response)
+            if LexborHTMLParser is not None:
+                pairs = self._extract_ids_lexbor(LexborHTMLParser(content))
+                parse_card = self._parse_card_lexbor
+            else:
+                # Imported here so processes that never hit the fallback
+                # (selectolax installed) don't pay bs4's import cost
+                from bs4 import BeautifulSoup
+                pairs = self._extract_ids(BeautifulSoup(content, 'lxml'))
+                parse_card = self._parse_card
             
-            # Parse the HTML content
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract observation data
+            # Diff IDs first - in steady state most cards are already known
+            # and never need the full field extraction
             observations = []
-            obs_cards = soup.select('.Observation')
-            
-            for card in obs_cards:
+            cached_by_id = {obs['id']: obs for obs in self._last_obs.get(alert_id, [])}
+            last_obs = []
+
+            for obs_id, card in pairs:
+                if skip_ids is not None and obs_id in skip_ids:
+                    # Already seen - keep any cached parse for the 304 path
+                    cached = cached_by_id.get(obs_id)
+                    if cached is not None:
+                        last_obs.append(cached)
+                    continue
                 try:
-                    # Extract the observation ID - this is in the card's id attribute
-                    obs_id = card.get('id', '').replace('obs-OBS', '')
-                    
-                    # Extract the checklist ID directly from the date link href
-                    date_link = card.select_one('.Observation-meta a[href*="/checklist/"]')
-                    checklist_id = None
-                    checklist_url = None
-                    
-                    if date_link and 'href' in date_link.attrs:
-                        checklist_href = date_link['href']
-                        # Extract the checklist ID (format: /checklist/S12345678)
-                        if '/checklist/' in checklist_href:
-                            checklist_id = checklist_href.split('/checklist/')[1]
-                            # Create the full URL
-                            checklist_url = f"https://ebird.org/checklist/{checklist_id}"
-                    
-                    if not checklist_url:
-                        # Fallback to using obs_id if we couldn't get the checklist ID
-                        logger.warning("Could not extract checklist ID from link - using fallback")
-                        checklist_url = f"https://ebird.org/checklist/{obs_id}"
-                    
-                    # Extract species name
-                    species_elem = card.select_one('.Observation-species a')
-                    if species_elem:
-                        species_main = species_elem.select_one('.Heading-main')
-                        species_sub = species_elem.select_one('.Heading-sub')
-                        
-                        main_text = species_main.text.strip() if species_main else ''
-                        scientific_name = species_sub.text.strip() if species_sub else ''
-                        
-                        species = main_text
-                    else:
-                        species = 'Unknown Species'
-                        scientific_name = ''
-                    
-                    # Extract count - looking specifically for the content after the visually hidden span
-                    count_container = card.select_one('.Observation-numberObserved')
-                    count = 'Unknown'
-                    if count_container:
-                        # First, try to find all spans that are not visually hidden
-                        non_hidden_spans = [
-                            span.text.strip() 
-                            for span in count_container.find_all('span') 
-                            if 'is-visuallyHidden' not in span.get('class', [])
-                        ]
-                        
-                        # If that didn't work, try getting all text and removing the label
-                        if non_hidden_spans:
-                            count = ' '.join(non_hidden_spans)
-                        else:
-                            all_text = count_container.text.strip()
-                            # Use regex to extract just the number after any text
-                            count_match = re.search(r'Number observed:\s*(.+)', all_text)
-                            if count_match:
-                                count = count_match.group(1).strip()
-                                
-                        # Clean up by removing any "Number observed:" text that might remain
-                        count = count.replace('Number observed:', '').strip()
-                    
-                    # Extract date - found in the link with checklist URL
-                    date_elem = card.select_one('.Observation-meta a[href*="/checklist/"]')
-                    date_str = date_elem.text.strip() if date_elem else 'Unknown Date'
-                    
-                    # Extract location - found in the a tag with google maps URL
-                    loc_elem = card.select_one('.Observation-meta a[href*="google.com/maps"]')
-                    location = loc_elem.text.strip() if loc_elem else 'Unknown Location'
-                    
-                    # Direct approach for observer extraction based on exact HTML pattern
-                    observer = 'eBird User'  # Default fallback
-                    
-                    # 1. First approach - Find the span with text "Observer:" and get its sibling
-                    observer_labels = card.find_all('span', class_='is-visuallyHidden')
-                    for label in observer_labels:
-                        if label.text.strip() == "Observer:":
-                            # The next sibling span should contain the observer name
-                            next_span = label.find_next_sibling('span')
-                            if next_span:
-                                observer = next_span.text.strip()
-                                break
-                    
-                    # 2. If that didn't work, look for the Icon--user and navigate to the name
-                    if observer == 'eBird User':
-                        user_icon = card.select_one('.Icon--user')
-                        if user_icon:
-                            # Get the parent container with flex structure
-                            flex_container = user_icon.find_parent('.GridFlex--flex')
-                            if flex_container:
-                                # The sizeFill div should contain both the hidden label and the name
-                                size_fill_div = flex_container.select_one('.GridFlex-cell.u-sizeFill')
-                                if size_fill_div:
-                                    # Get the second span which should contain the name
-                                    spans = size_fill_div.find_all('span')
-                                    if len(spans) >= 2:
-                                        observer = spans[1].text.strip()
-                    
-                    # 3. Last resort - try to get direct HTML and parse with regex
-                    if observer == 'eBird User' and user_icon:
-                        parent_cell = user_icon.find_parent('.GridFlex-cell')
-                        if parent_cell:
-                            parent_div = parent_cell.find_parent('div')
-                            if parent_div:
-                                html_content = str(parent_div)
-                                name_match = re.search(r'Observer:</span>\s*<span>\s*(.*?)\s*</span>', html_content)
-                                if name_match:
-                                    observer = name_match.group(1)
-                    
-                    # Create observation with field names matching eBird terminology
-                    observation = {
-                        'id': obs_id,
-                        'species': species,
-                        'scientificName': scientific_name,
-                        'count': count,
-                        'date': date_str,
-                        'location': location,
-                        'observer': observer,
-                        'checklistUrl': checklist_url
-                    }
-                    
+                    observation = parse_card(obs_id, card)
                     observations.append(observation)
-                    logger.debug(f"Parsed observation: {species}")
-                except Exception as e:
+                    last_obs.append(observation)
+                except (KeyError, AttributeError) as e:
+                    # Missing attrs/elements are the only failures malformed
+                    # markup can realistically produce; anything else is a bug
+                    # that shouldn't be silently swallowed per card
                     logger.error(f"Error parsing observation card: {e}")
-            
+
+            self._last_obs[alert_id] = last_obs
             return observations
-            
+
         except Exception as e:
             logger.error(f"Error fetching alerts for {county['name']} County: {e}")
             return []
+
+    def _parse_card(self, obs_id: str, card) -> Dict[str, Any]:
+        """
+        Parse the full field set from a single observation card
+
+        Args:
+            obs_id: Observation ID extracted from the card's id attribute
+            card: BeautifulSoup element for the .Observation div
+
+        Returns:
+            Observation dictionary with field names matching eBird terminology
+        """
+        # The checklist link carries both the checklist href and the
+        # date text - select it once and derive both fields from it
+        date_link = _SEL_CHECKLIST_LINK.select_one(card)
+        checklist_id = None
+        checklist_url = None
+        
+        if date_link and 'href' in date_link.attrs:
+            checklist_href = date_link['href']
+            # Extract the checklist ID (format: /checklist/S12345678)
+            if '/checklist/' in checklist_href:
+                checklist_id = checklist_href.split('/checklist/')[1]
+                # Create the full URL
+                checklist_url = f"https://ebird.org/checklist/{checklist_id}"
+        
+        if not checklist_url:
+            # Fallback to using obs_id if we couldn't get the checklist ID
+            logger.warning("Could not extract checklist ID from link - using fallback")
+            checklist_url = f"https://ebird.org/checklist/{obs_id}"
+        
+        # Extract species name
+        species_elem = _SEL_SPECIES.select_one(card)
+        if species_elem:
+            species_main = _SEL_HEADING_MAIN.select_one(species_elem)
+            species_sub = _SEL_HEADING_SUB.select_one(species_elem)
+            
+            main_text = species_main.text.strip() if species_main else ''
+            scientific_name = species_sub.text.strip() if species_sub else ''
+            
+            species = main_text
+        else:
+            species = 'Unknown Species'
+            scientific_name = ''
+        
+        # Extract count - looking specifically for the content after the visually hidden span
+        count_container = _SEL_COUNT.select_one(card)
+        count = 'Unknown'
+        if count_container:
+            # First, try to find all spans that are not visually hidden -
+            # the :not() filter runs inside soupsieve rather than as a
+            # Python-level class check per span
+            non_hidden_spans = [
+                span.text.strip()
+                for span in _SEL_VISIBLE_SPANS.select(count_container)
+            ]
+            
+            # If that didn't work, try getting all text and removing the label
+            if non_hidden_spans:
+                count = ' '.join(non_hidden_spans)
+            else:
+                all_text = count_container.text.strip()
+                # Use regex to extract just the number after any text
+                count_match = _COUNT_RE.search(all_text)
+                if count_match:
+                    count = count_match.group(1).strip()
+                    
+            # Clean up by removing any "Number observed:" text that might remain
+            count = count.replace('Number observed:', '').strip()
+        
+        # Extract date - same link selected above for the checklist URL
+        date_str = date_link.text.strip() if date_link else 'Unknown Date'
+        
+        # Extract location - found in the a tag with google maps URL
+        loc_elem = _SEL_LOC.select_one(card)
+        location = loc_elem.text.strip() if loc_elem else 'Unknown Location'
+        
+        # Extract observer - one targeted selector for the name span
+        # next to the hidden "Observer:" label
+        observer = 'eBird User'  # Default fallback
+        obs_span = _SEL_OBSERVER.select_one(card)
+        if obs_span and obs_span.text.strip():
+            observer = obs_span.text.strip()
+        else:
+            # Fallback: find the hidden "Observer:" label and take its sibling
+            for label in card.find_all('span', class_='is-visuallyHidden'):
+                if label.text.strip() == "Observer:":
+                    next_span = label.find_next_sibling('span')
+                    if next_span:
+                        observer = next_span.text.strip()
+                    break
+        
+        # Create observation with field names matching eBird terminology
+        observation = {
+            'id': obs_id,
+            'species': species,
+            'scientificName': scientific_name,
+            'count': count,
+            'date': date_str,
+            'location': location,
+            'observer': observer,
+            'checklistUrl': checklist_url
+        }
+
+        # Lazy %s formatting - no f-string built when DEBUG is off
+        logger.debug("Parsed observation: %s", species)
+        return observation
+
+    def _parse_card_lexbor(self, obs_id: str, card) -> Dict[str, Any]:
+        """
+        Lexbor counterpart of _parse_card
+
+        Same extraction logic against selectolax's node API, which exposes
+        flat C-backed nodes instead of per-tag Python objects.
+
+        Args:
+            obs_id: Observation ID extracted from the card's id attribute
+            card: LexborNode for the .Observation div
+
+        Returns:
+            Observation dictionary with field names matching eBird terminology
+        """
+        # The checklist link carries both the checklist href and the
+        # date text - select it once and derive both fields from it
+        date_link = card.css_first('.Observation-meta a[href*="/checklist/"]')
+        checklist_url = None
+
+        if date_link:
+            checklist_href = date_link.attributes.get('href') or ''
+            # Extract the checklist ID (format: /checklist/S12345678)
+            if '/checklist/' in checklist_href:
+                checklist_id = checklist_href.split('/checklist/')[1]
+                checklist_url = f"https://ebird.org/checklist/{checklist_id}"
+
+        if not checklist_url:
+            # Fallback to using obs_id if we couldn't get the checklist ID
+            logger.warning("Could not extract checklist ID from link - using fallback")
+            checklist_url = f"https://ebird.org/checklist/{obs_id}"
+
+        # Extract species name
+        species_elem = card.css_first('.Observation-species a')
+        if species_elem:
+            species_main = species_elem.css_first('.Heading-main')
+            species_sub = species_elem.css_first('.Heading-sub')
+
+            species = species_main.text().strip() if species_main else ''
+            scientific_name = species_sub.text().strip() if species_sub else ''
+        else:
+            species = 'Unknown Species'
+            scientific_name = ''
+
+        # Extract count - looking specifically for the content after the visually hidden span
+        count_container = card.css_first('.Observation-numberObserved')
+        count = 'Unknown'
+        if count_container:
+            non_hidden_spans = [
+                span.text().strip()
+                for span in count_container.css('span:not(.is-visuallyHidden)')
+            ]
+
+            # If that didn't work, try getting all text and removing the label
+            if non_hidden_spans:
+                count = ' '.join(non_hidden_spans)
+            else:
+                all_text = count_container.text().strip()
+                # Use regex to extract just the number after any text
+                count_match = _COUNT_RE.search(all_text)
+                if count_match:
+                    count = count_match.group(1).strip()
+
+            # Clean up by removing any "Number observed:" text that might remain
+            count = count.replace('Number observed:', '').strip()
+
+        # Extract date - same link selected above for the checklist URL
+        date_str = date_link.text().strip() if date_link else 'Unknown Date'
+
+        # Extract location - found in the a tag with google maps URL
+        loc_elem = card.css_first('.Observation-meta a[href*="google.com/maps"]')
+        location = loc_elem.text().strip() if loc_elem else 'Unknown Location'
+
+        # Extract observer - one targeted selector for the name span
+        # next to the hidden "Observer:" label
+        observer = 'eBird User'  # Default fallback
+        obs_span = card.css_first('.GridFlex--flex .GridFlex-cell.u-sizeFill span:not(.is-visuallyHidden)')
+        if obs_span and obs_span.text().strip():
+            observer = obs_span.text().strip()
+        else:
+            # Fallback: find the hidden "Observer:" label and take its sibling
+            for label in card.css('span.is-visuallyHidden'):
+                if label.text().strip() == "Observer:":
+                    next_node = label.next
+                    while next_node is not None and next_node.tag != 'span':
+                        next_node = next_node.next
+                    if next_node is not None:
+                        observer = next_node.text().strip()
+                    break
+
+        # Create observation with field names matching eBird terminology
+        observation = {
+            'id': obs_id,
+            'species': species,
+            'scientificName': scientific_name,
+            'count': count,
+            'date': date_str,
+            'location': location,
+            'observer': observer,
+            'checklistUrl': checklist_url
+        }
+
+        logger.debug("Parsed observation: %s", species)
+        return observation
     
-    def get_new_alerts(self, county: Dict[str, str]) -> List[Dict[str, Any]]:
+    def get_new_alerts(self, county: Dict[str, str],
+                       prefetched: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Get new alerts that haven't been seen before
-        
+
         Args:
             county: County information
-            
+            prefetched: Optional already-fetched alerts for this county,
+                diffed directly instead of hitting eBird again
+
         Returns:
             List of new alert dictionaries
         """
         alert_id = county['alert_id']
-        all_alerts = self.fetch_alerts(county)
-        
-        # Initialize this county in previous alerts if not exists
-        if alert_id not in self.previous_alerts:
-            self.previous_alerts[alert_id] = []
-        
-        # Filter to only new alerts
-        new_alerts = []
-        for alert in all_alerts:
-            if alert['id'] not in self.previous_alerts[alert_id]:
-                new_alerts.append(alert)
-                self.previous_alerts[alert_id].append(alert['id'])
-        
-        # Save updated previous alerts if there are new ones
-        if new_alerts:
-            self._save_previous_alerts()
-            
-        return new_alerts
\ No newline at end of file
+
+        if prefetched is not None:
+            all_alerts = prefetched
+        else:
+            # Snapshot the seen set so the fetch can skip parsing known cards
+            with self._lock:
+                skip_ids = set(self.previous_alerts.get(alert_id, ()))
+
+            all_alerts = self.fetch_alerts(county, skip_ids=skip_ids)
+
+        with self._lock:
+            # Initialize this county in previous alerts if not exists
+            seen = self.previous_alerts.setdefault(alert_id, set())
+
+            # Filter to only new alerts
+            new_alerts = []
+            for alert in all_alerts:
+                if alert['id'] not in seen:
+                    new_alerts.append(alert)
+                    seen.add(alert['id'])
+
+            # Mark for save - the caller flushes once per cycle rather than
+            # rewriting the file for every county that has new alerts
+            if new_alerts:
+                self._dirty = True
+
+        return new_alerts
+
+    def flush(self):
+        """Write previous_alerts to disk if any county added new IDs"""
+        with self._lock:
+            if self._dirty:
+                self._save_previous_alerts()
+                self._dirty = False
\ No newline at end of file
@@ -2,8 +2,12 @@
 Main application for monitoring eBird Rare Bird Alerts and sending notifications
 """
 import logging
+import signal
+import threading
 import time
-import schedule
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from typing import Dict, Any, List
 import sys
 import os
@@ -16,111 +20,149 @@ from src.notifier import Notifier
 from config.config import COUNTIES, CHECK_INTERVAL, DATA_STORAGE_FILE, NOTIFY_ON_STARTUP
 from config.config import ENABLE_TEXT_NOTIFICATIONS, ENABLE_DISCORD_NOTIFICATIONS
 
-# Set up logging
-logging.basicConfig(
-    filename='logs/monitor.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Set up logging - attach the handler to this module's logger directly;
+# basicConfig only takes effect for whichever module configures the root
+# logger first (run.py, or ebird_fetcher imported above), so it can't be
+# relied on here. Records buffer in memory and flush in batches to a
+# size-capped rotating file (ERROR and above flush immediately), and
+# still propagate to whatever root handlers are installed.
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+_file_handler = RotatingFileHandler('logs/monitor.log', maxBytes=5_000_000, backupCount=3)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logger.addHandler(MemoryHandler(capacity=200, target=_file_handler))
 
-def check_for_alerts(is_startup_run=False):
+def check_for_alerts(fetcher, notifier, is_startup_run=False, preloaded=None):
     """
     Check for new alerts and send notifications
-    
+
     Args:
+        fetcher: Shared EBirdFetcher instance
+        notifier: Shared Notifier instance
         is_startup_run: Whether this is the first run at application startup
+        preloaded: Optional dict of already-fetched alerts keyed by alert_id
+            (from check_interactive), used to avoid re-fetching from eBird
     """
     try:
         logger.info("Starting alert check")
-        
-        # Initialize the fetcher and notifier
-        fetcher = EBirdFetcher(DATA_STORAGE_FILE)
-        notifier = Notifier()
-        
-        # Check each configured county
-        for county in COUNTIES:
-            logger.info(f"Checking {county['name']} County, {county['state']}")
-            
-            # Get new alerts for this county
-            new_alerts = fetcher.get_new_alerts(county)
-            
+
+        # Pick up external edits to the storage file (no-op otherwise)
+        fetcher.reload_if_changed()
+
+        def check_county(county):
+            prefetched = preloaded.get(county['alert_id']) if preloaded else None
+            return fetcher.get_new_alerts(county, prefetched=prefetched)
+
+        # Fetch all counties concurrently - each check blocks on an HTTP GET,
+        # so total latency stays ~one round-trip regardless of county count
+        if len(COUNTIES) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(COUNTIES))) as executor:
+                results = list(executor.map(check_county, COUNTIES))
+        else:
+            results = [check_county(county) for county in COUNTIES]
+
+        # Dispatch notifications from the main thread; Discord embeds are
+        # accumulated across counties and sent in batched POSTs at the end.
+        # A checklist straddling two county alert zones shows up under both
+        # alert_ids with different observation IDs, so dedup by content
+        # fingerprint to avoid notifying twice for the same sighting
+        pending_discord = []
+        dispatched = set()
+        for county, new_alerts in zip(COUNTIES, results):
             if new_alerts:
-                logger.info(f"Found {len(new_alerts)} new alerts for {county['name']} County")
+                logger.info("Found %d new alerts for %s County", len(new_alerts), county['name'])
                 
                 # Process each new alert
                 for alert in new_alerts:
                     # Log the alert
-                    logger.info(f"New alert: {alert['species']} at {alert['location']}")
+                    logger.info("New alert: %s at %s", alert['species'], alert['location'])
                     
                     # Send notifications based on configuration
                     # Skip notifications at startup if configured to do so
                     should_notify = True
                     if is_startup_run and not NOTIFY_ON_STARTUP:
-                        logger.info(f"Skipping notification for {alert['species']} (startup notification disabled)")
+                        logger.info("Skipping notification for %s (startup notification disabled)", alert['species'])
                         should_notify = False
                     
+                    fingerprint = (alert['species'], alert['location'], alert['observer'], alert['date'])
+                    if fingerprint in dispatched:
+                        logger.info("Skipping duplicate notification for %s (already dispatched this run)", alert['species'])
+                        should_notify = False
+                    else:
+                        dispatched.add(fingerprint)
+
                     if should_notify:
                         notifier.notify_new_bird(
                             alert=alert,
                             county=county,
                             use_text=ENABLE_TEXT_NOTIFICATIONS,
-                            use_discord=ENABLE_DISCORD_NOTIFICATIONS
+                            use_discord=False
                         )
+                        if ENABLE_DISCORD_NOTIFICATIONS and notifier.discord_enabled:
+                            pending_discord.append(notifier.make_discord_embed(alert, county))
             else:
-                logger.info(f"No new alerts for {county['name']} County")
-                
+                logger.info("No new alerts for %s County", county['name'])
+
+        # One webhook POST per 10 alerts instead of one per alert
+        if pending_discord:
+            notifier.flush_discord_batch(pending_discord)
+
+        # One storage write per cycle regardless of how many counties fired
+        fetcher.flush()
+
         logger.info("Alert check completed")
     except Exception as e:
-        logger.error(f"Error during alert check: {e}")
+        logger.error("Error during alert check: %s", e)
 
-def check_interactive(interactive=False):
+def check_interactive(fetcher, interactive=False):
     """
     Check for alerts in interactive mode, allowing user to choose notification behavior
-    
+
     Args:
+        fetcher: Shared EBirdFetcher instance
         interactive: Whether to run in interactive mode with user prompts
-    
+
     Returns:
-        List of new alerts found across all counties
+        Tuple of (new alerts found across all counties, fetched alerts
+        keyed by alert_id for reuse via check_for_alerts' preloaded arg)
     """
     all_new_alerts = []
-    
+    fetched = {}
+
     try:
         logger.info("Starting interactive alert check")
-        
-        # Initialize the fetcher but don't save changes yet
-        fetcher = EBirdFetcher(DATA_STORAGE_FILE)
-        previous_alerts = fetcher.previous_alerts.copy()
-        
+
         # Check each configured county and collect alerts without saving
         for county in COUNTIES:
-            county_name = f"{county['name']} County, {county['state']}"
-            logger.info(f"Checking {county_name}")
-            
+            county_name = county['display']
+            logger.info("Checking %s", county_name)
+
             # Get all alerts (not saving to previous_alerts yet)
             all_alerts = fetcher.fetch_alerts(county)
-            
-            # Filter for new alerts
-            alert_id = county['alert_id']
-            if alert_id not in previous_alerts:
-                previous_alerts[alert_id] = []
-                
+            fetched[county['alert_id']] = all_alerts
+
+            # Preview against the loaded state directly - it's never mutated
+            # here, so no snapshot copy is needed; a small per-county set
+            # guards against duplicate IDs within this fetch
+            county_seen = fetcher.previous_alerts.get(county['alert_id'], ())
+            run_seen = set()
+
             new_alerts = []
             for alert in all_alerts:
-                if alert['id'] not in previous_alerts[alert_id]:
+                if alert['id'] not in county_seen and alert['id'] not in run_seen:
+                    run_seen.add(alert['id'])
                     new_alerts.append(alert)
                     all_new_alerts.append((county, alert))
             
             if new_alerts:
-                logger.info(f"Found {len(new_alerts)} new alerts for {county_name}")
+                logger.info("Found %d new alerts for %s", len(new_alerts), county_name)
             else:
-                logger.info(f"No new alerts for {county_name}")
+                logger.info("No new alerts for %s", county_name)
                 
     except Exception as e:
-        logger.error(f"Error during interactive alert check: {e}")
-        
-    return all_new_alerts
+        logger.error("Error during interactive alert check: %s", e)
+
+    return all_new_alerts, fetched
 
 def main():
     """Main function to start the monitor"""
@@ -129,30 +171,34 @@ def main():
         os.makedirs('logs', exist_ok=True)
         
         logger.info("Starting eBird Rare Bird Alert Monitor")
-        
+
+        # Initialize the fetcher and notifier once - the fetcher's in-memory
+        # previous_alerts dict is the source of truth for all later checks
+        fetcher = EBirdFetcher(DATA_STORAGE_FILE)
+        notifier = Notifier()
+
         # Check if running in interactive terminal
         interactive = sys.stdout.isatty()
-        
+
         if interactive:
             # Interactive mode - summarize and ask for confirmation
-            all_new_alerts = check_interactive(interactive=True)
+            all_new_alerts, fetched = check_interactive(fetcher, interactive=True)
             
             if all_new_alerts:
-                print(f"\nFound {len(all_new_alerts)} new rare bird alerts:")
-                
                 # Group by county for better readability
-                by_county = {}
+                by_county = defaultdict(list)
                 for county, alert in all_new_alerts:
-                    county_name = f"{county['name']} County, {county['state']}"
-                    if county_name not in by_county:
-                        by_county[county_name] = []
-                    by_county[county_name].append(alert)
-                
-                # Print summary by county
+                    by_county[county['display']].append(alert)
+
+                # Build the summary in one buffer and emit it in a single
+                # write instead of one print syscall per alert
+                lines = [f"\nFound {len(all_new_alerts)} new rare bird alerts:"]
                 for county_name, alerts in by_county.items():
-                    print(f"\n{county_name}:")
+                    lines.append(f"\n{county_name}:")
                     for alert in alerts:
-                        print(f"  - {alert['species']} ({alert['count']}) at {alert['location']} by {alert['observer']}")
+                        lines.append(f"  - {alert['species']} ({alert['count']}) at {alert['location']} by {alert['observer']}")
+                sys.stdout.write('\n'.join(lines) + '\n')
+                sys.stdout.flush()
                 
                 # Ask user what to do
                 notify_choice = None
@@ -162,34 +208,48 @@ def main():
                 # Run with appropriate parameters based on user choice
                 if notify_choice == 'y':
                     print("Sending notifications for all alerts...")
-                    check_for_alerts(is_startup_run=False)  # Full notifications
+                    check_for_alerts(fetcher, notifier, is_startup_run=False, preloaded=fetched)  # Full notifications
                 elif notify_choice == 'n':
                     print("Skipping these alerts entirely...")
                     # Do nothing - alerts won't be saved to previous_alerts
                 else:  # silent mode
                     print("Recording alerts without notifications...")
-                    check_for_alerts(is_startup_run=True)  # No notifications if NOTIFY_ON_STARTUP is False
+                    check_for_alerts(fetcher, notifier, is_startup_run=True, preloaded=fetched)  # No notifications if NOTIFY_ON_STARTUP is False
             else:
                 print("No new rare bird alerts found.")
                 # Still run check_for_alerts to ensure data structures are initialized
-                check_for_alerts(is_startup_run=True)
+                check_for_alerts(fetcher, notifier, is_startup_run=True, preloaded=fetched)
         else:
             # Non-interactive mode - use configuration setting
-            check_for_alerts(is_startup_run=True)
-        
-        # Schedule regular checks
-        schedule.every(CHECK_INTERVAL).minutes.do(check_for_alerts)
-        
-        logger.info(f"Monitor scheduled to check every {CHECK_INTERVAL} minutes")
-        
-        # Run the scheduler in a loop
-        while True:
-            schedule.run_pending()
-            time.sleep(1)
+            check_for_alerts(fetcher, notifier, is_startup_run=True)
+
+        logger.info("Monitor scheduled to check every %d minutes", CHECK_INTERVAL)
+
+        # Sleep in one kernel wait per interval instead of polling a scheduler
+        # every second; SIGTERM/SIGINT wake the wait for a clean Docker shutdown
+        stop_event = threading.Event()
+
+        def _request_stop(signum, frame):
+            stop_event.set()
+
+        signal.signal(signal.SIGTERM, _request_stop)
+        signal.signal(signal.SIGINT, _request_stop)
+
+        # Wait to an absolute monotonic deadline so the interval doesn't
+        # drift by however long each check takes
+        next_run = time.monotonic() + CHECK_INTERVAL * 60
+        while not stop_event.wait(max(0, next_run - time.monotonic())):
+            check_for_alerts(fetcher, notifier)
+            next_run += CHECK_INTERVAL * 60
+
+        # Let queued notifications finish before the process exits
+        notifier.wait_for_pending()
+
+        logger.info("Monitor stopped")
     except KeyboardInterrupt:
         logger.info("Monitor stopped by user")
     except Exception as e:
-        logger.error(f"Unexpected error in main loop: {e}")
+        logger.error("Unexpected error in main loop: %s", e)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
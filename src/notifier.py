@@ -3,23 +3,92 @@ Module to handle sending notifications via text and Discord
 """
 import os
 import logging
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from typing import Dict, Any, List
-from discord_webhook import DiscordWebhook, DiscordEmbed
-from twilio.rest import Client
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
-# Set up logging
-logging.basicConfig(
-    filename='logs/notifier.log',
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# The Twilio and discord_webhook SDKs are imported lazily in the branches
+# that actually use them - both are heavyweight and a deployment typically
+# enables only one channel
+
+# Set up logging - attach the handler to this module's logger directly;
+# basicConfig only takes effect for whichever module configures the root
+# logger first, so it can't be relied on here. Records buffer in memory
+# and flush in batches to a size-capped rotating file (ERROR and above
+# flush immediately), and still propagate to whatever root handlers are
+# installed.
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+_file_handler = RotatingFileHandler('logs/notifier.log', maxBytes=5_000_000, backupCount=3)
+_file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+logger.addHandler(MemoryHandler(capacity=200, target=_file_handler))
 
 # Load environment variables
 load_dotenv(dotenv_path='config/.env')
 
+# One pooled session for all outbound notification HTTPS - keeps the TLS
+# connections to discord.com and api.twilio.com alive between notifications
+# instead of paying a full handshake per message
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Text-message template built once at import; a single format call fills the
+# per-alert fields instead of chaining f-string concatenations per alert
+_TEXT_TMPL = (
+    "New Rare Bird Alert!\n"
+    "{species_text} - Count: {count}\n"
+    "Date: {date}\n"
+    "Location: {location}, {county_display}\n"
+    "Observer: {observer}\n"
+    "View checklist: {checklist_url}"
+)
+
+# Discord embed field layout defined once; make_discord_embed only fills in
+# the per-alert values
+_EMBED_FIELDS = (
+    ("Species", "species"),
+    ("Count", "count"),
+    ("Date", "date"),
+    ("Location", "location"),
+    ("Observer", "observer"),
+)
+
+@lru_cache(maxsize=None)
+def _discord_classes():
+    """Import discord_webhook on first use; cached so repeat calls are free
+
+    Returns:
+        (webhook class, embed class) tuple - the webhook class posts through
+        the shared pooled session
+    """
+    from discord_webhook import DiscordWebhook, DiscordEmbed
+
+    class _PooledDiscordWebhook(DiscordWebhook):
+        """DiscordWebhook that posts through the shared pooled session
+
+        Only the no-attachment path is overridden (this app never sends
+        files); the rate_limit_retry handling in execute() is unaffected.
+        """
+        def api_post_request(self):
+            if not self.files:
+                return _SESSION.post(
+                    self.url,
+                    json=self.json,
+                    params=self._query_params,
+                    proxies=self.proxies,
+                    timeout=self.timeout,
+                )
+            return super().api_post_request()
+
+    return _PooledDiscordWebhook, DiscordEmbed
+
 class Notifier:
     def __init__(self):
         """Initialize the notification services"""
@@ -32,6 +101,15 @@ class Notifier:
         # Initialize Discord webhook
         self.discord_enabled = False
         self.discord_webhook_url = None
+
+        # SMS sends are pure network waits - fan them out so delivery time
+        # stays ~one round-trip regardless of recipient count
+        self._sms_pool = ThreadPoolExecutor(max_workers=8)
+
+        # Deliver notifications from a dedicated worker thread so Discord
+        # rate-limit retries and Twilio latency never stall the alert check
+        self._queue = queue.Queue(maxsize=1000)
+        threading.Thread(target=self._drain_queue, daemon=True).start()
         
         # Try to set up Twilio
         try:
@@ -41,14 +119,20 @@ class Notifier:
             to_numbers = os.getenv('TWILIO_TO_NUMBERS')
             
             if account_sid and auth_token and self.twilio_from and to_numbers:
-                self.twilio_client = Client(account_sid, auth_token)
+                from twilio.rest import Client
+                from twilio.http.http_client import TwilioHttpClient
+
+                # Route Twilio through the shared pooled session as well
+                http_client = TwilioHttpClient()
+                http_client.session = _SESSION
+                self.twilio_client = Client(account_sid, auth_token, http_client=http_client)
                 self.twilio_to_numbers = to_numbers.split(',')
                 self.twilio_enabled = True
                 logger.info("Twilio notification service initialized successfully")
             else:
                 logger.warning("Twilio not fully configured - text notifications disabled")
         except Exception as e:
-            logger.error(f"Error initializing Twilio: {e}")
+            logger.error("Error initializing Twilio: %s", e)
         
         # Try to set up Discord webhook
         try:
@@ -59,7 +143,7 @@ class Notifier:
             else:
                 logger.warning("Discord webhook URL not configured - Discord notifications disabled")
         except Exception as e:
-            logger.error(f"Error initializing Discord webhook: {e}")
+            logger.error("Error initializing Discord webhook: %s", e)
     
     def send_text_notification(self, message: str) -> bool:
         """
@@ -75,18 +159,31 @@ class Notifier:
             logger.warning("Attempted to send text but Twilio is not configured")
             return False
         
-        try:
-            for to_number in self.twilio_to_numbers:
-                self.twilio_client.messages.create(
-                    body=message,
-                    from_=self.twilio_from,
-                    to=to_number
-                )
-            logger.info(f"Text notification sent to {len(self.twilio_to_numbers)} recipients")
-            return True
-        except Exception as e:
-            logger.error(f"Error sending text notification: {e}")
-            return False
+        # Submit all recipients at once; the Twilio client is thread-safe
+        # (pooled requests.Session underneath)
+        futures = {
+            self._sms_pool.submit(
+                self.twilio_client.messages.create,
+                body=message,
+                from_=self.twilio_from,
+                to=to_number
+            ): to_number
+            for to_number in self.twilio_to_numbers
+        }
+        wait(futures, timeout=10)
+
+        # Collect failures per recipient so one bad number doesn't fail the batch
+        sent = 0
+        for future, to_number in futures.items():
+            try:
+                future.result(timeout=0)
+                sent += 1
+            except Exception as e:
+                logger.error("Error sending text notification to %s: %s", to_number, e)
+
+        if sent:
+            logger.info("Text notification sent to %d of %d recipients", sent, len(self.twilio_to_numbers))
+        return sent == len(self.twilio_to_numbers)
     
     def send_discord_notification(self, title: str, description: str, fields: List[Dict[str, str]] = None, 
                                  color: str = "03b2f8") -> bool:
@@ -107,9 +204,11 @@ class Notifier:
             return False
         
         try:
+            webhook_cls, embed_cls = _discord_classes()
+
             # Use the built-in rate limiting retry functionality
-            webhook = DiscordWebhook(url=self.discord_webhook_url, rate_limit_retry=True)
-            embed = DiscordEmbed(title=title, description=description, color=color)
+            webhook = webhook_cls(url=self.discord_webhook_url, rate_limit_retry=True)
+            embed = embed_cls(title=title, description=description, color=color)
             
             if fields:
                 for field in fields:
@@ -125,15 +224,123 @@ class Notifier:
             # Still check for error status codes other than rate limiting
             status = getattr(response, 'status_code', None)
             if status and status >= 400:
-                logger.error(f"Discord webhook returned status code {status}: {getattr(response, 'text', '')}")
+                logger.error("Discord webhook returned status code %s: %s", status, getattr(response, 'text', ''))
                 return False
                 
             logger.info("Discord notification sent successfully")
             return True
         except Exception as e:
-            logger.error(f"Error sending Discord notification: {e}")
+            logger.error("Error sending Discord notification: %s", e)
             return False
-            
+
+    def make_discord_embed(self, alert: Dict[str, Any], county: Dict[str, str]) -> tuple:
+        """
+        Build the Discord embed content for a single alert
+
+        Args:
+            alert: Dictionary containing alert details
+            county: Dictionary with county information
+
+        Returns:
+            (title, description, fields) tuple for flush_discord_batch
+        """
+        title = f"🦜 New Rare Bird Alert: {alert['species']}"
+        scientific_name = f"*{alert['scientificName']}*" if 'scientificName' in alert and alert['scientificName'] else ""
+        description = f"A rare bird has been spotted in {county['display']}!"
+        if scientific_name:
+            description += f"\n{scientific_name}"
+
+        fields = [
+            {"name": name, "value": alert[key], "inline": True}
+            for name, key in _EMBED_FIELDS
+        ]
+        fields.append(
+            {"name": "View", "value": f"[eBird Checklist]({alert['checklistUrl']})", "inline": True}
+        )
+
+        return (title, description, fields)
+
+    def flush_discord_batch(self, pending: List[tuple], color: str = "f8aa03") -> None:
+        """
+        Queue accumulated embeds for background delivery
+
+        Args:
+            pending: List of (title, description, fields) tuples from
+                make_discord_embed
+            color: Hex color for the embeds
+        """
+        if not self.discord_enabled:
+            logger.warning("Attempted to send Discord batch but webhook is not configured")
+            return
+        self._enqueue('discord_batch', (list(pending), color))
+
+    def _enqueue(self, kind: str, payload) -> None:
+        """Hand a notification to the worker thread without blocking"""
+        try:
+            self._queue.put_nowait((kind, payload))
+        except queue.Full:
+            logger.error("Notification queue full - dropping %s notification", kind)
+
+    def _drain_queue(self):
+        """Worker loop: deliver queued notifications in order"""
+        while True:
+            kind, payload = self._queue.get()
+            try:
+                if kind == 'text':
+                    self.send_text_notification(payload)
+                elif kind == 'discord_batch':
+                    pending, color = payload
+                    self._send_discord_batch(pending, color)
+            except Exception as e:
+                logger.error("Error delivering queued %s notification: %s", kind, e)
+            finally:
+                self._queue.task_done()
+
+    def wait_for_pending(self) -> None:
+        """Block until every queued notification has been delivered"""
+        self._queue.join()
+
+    def _send_discord_batch(self, pending: List[tuple], color: str) -> bool:
+        """
+        Send embeds, up to 10 per webhook POST (Discord's cap)
+
+        Args:
+            pending: List of (title, description, fields) tuples
+            color: Hex color for the embeds
+
+        Returns:
+            Boolean indicating all batches were sent successfully
+        """
+
+        webhook_cls, embed_cls = _discord_classes()
+
+        all_sent = True
+        for start in range(0, len(pending), 10):
+            try:
+                webhook = webhook_cls(url=self.discord_webhook_url, rate_limit_retry=True)
+                for title, description, fields in pending[start:start + 10]:
+                    embed = embed_cls(title=title, description=description, color=color)
+                    for field in fields:
+                        embed.add_embed_field(
+                            name=field.get('name', ''),
+                            value=field.get('value', ''),
+                            inline=field.get('inline', False)
+                        )
+                    webhook.add_embed(embed)
+                response = webhook.execute()
+
+                status = getattr(response, 'status_code', None)
+                if status and status >= 400:
+                    logger.error("Discord webhook returned status code %s: %s", status, getattr(response, 'text', ''))
+                    all_sent = False
+            except Exception as e:
+                logger.error("Error sending Discord batch: %s", e)
+                all_sent = False
+
+        if all_sent:
+            logger.info("Discord batch of %d embeds sent successfully", len(pending))
+        return all_sent
+
     def notify_new_bird(self, alert: Dict[str, Any], county: Dict[str, str], use_text: bool = True, 
                        use_discord: bool = True) -> None:
         """
@@ -145,44 +352,30 @@ class Notifier:
             use_text: Whether to send a text notification
             use_discord: Whether to send a Discord notification
         """
-        # Create text message
-        species_text = alert['species']
-        if 'scientificName' in alert and alert['scientificName']:
-            species_text += f" ({alert['scientificName']})"
-            
-        text_message = (
-            f"New Rare Bird Alert!\n"
-            f"{species_text} - Count: {alert['count']}\n"
-            f"Date: {alert['date']}\n"
-            f"Location: {alert['location']}, {county['name']} County, {county['state']}\n"
-            f"Observer: {alert['observer']}\n"
-            f"View checklist: {alert['checklistUrl']}"
-        )
-        
-        # Send text if enabled
-        if use_text and self.twilio_enabled:
-            self.send_text_notification(text_message)
-        
-        # Send Discord notification if enabled
-        if use_discord and self.discord_enabled:
-            title = f"🦜 New Rare Bird Alert: {alert['species']}"
-            scientific_name = f"*{alert['scientificName']}*" if 'scientificName' in alert and alert['scientificName'] else ""
-            description = f"A rare bird has been spotted in {county['name']} County, {county['state']}!"
-            if scientific_name:
-                description += f"\n{scientific_name}"
-            
-            fields = [
-                {"name": "Species", "value": alert['species'], "inline": True},
-                {"name": "Count", "value": alert['count'], "inline": True},
-                {"name": "Date", "value": alert['date'], "inline": True},
-                {"name": "Location", "value": alert['location'], "inline": True},
-                {"name": "Observer", "value": alert['observer'], "inline": True},
-                {"name": "View", "value": f"[eBird Checklist]({alert['checklistUrl']})", "inline": True}
-            ]
-            
-            self.send_discord_notification(
-                title=title,
-                description=description,
-                fields=fields,
-                color="f8aa03"  # Orange/yellow color
-            )
\ No newline at end of file
+        # Skip all message building when neither channel will fire
+        # (e.g. silent-record mode)
+        want_text = use_text and self.twilio_enabled
+        want_discord = use_discord and self.discord_enabled
+        if not (want_text or want_discord):
+            return
+
+        # Queue text if enabled - delivery happens on the worker thread
+        if want_text:
+            species_text = alert['species']
+            if 'scientificName' in alert and alert['scientificName']:
+                species_text += f" ({alert['scientificName']})"
+
+            text_message = _TEXT_TMPL.format(
+                species_text=species_text,
+                count=alert['count'],
+                date=alert['date'],
+                location=alert['location'],
+                county_display=county['display'],
+                observer=alert['observer'],
+                checklist_url=alert['checklistUrl']
+            )
+            self._enqueue('text', text_message)
+
+        # Queue Discord notification if enabled
+        if want_discord:
+            self.flush_discord_batch([self.make_discord_embed(alert, county)])
\ No newline at end of file
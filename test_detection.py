@@ -7,6 +7,12 @@ by simulating a scenario with known observations and then adding "new" ones.
 import os
 import json
 import time
+
+# Same fast-path/fallback split as EBirdFetcher
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import logging
 from datetime import datetime
 import shutil
@@ -87,9 +93,11 @@ class TestEBirdFetcher(EBirdFetcher):
         super().__init__(data_storage_file)
         self.test_observations = observations or []
         
-    def fetch_alerts(self, county):
+    def fetch_alerts(self, county, skip_ids=None):
         """Return predefined test observations instead of fetching from eBird"""
         print(f"Simulating fetch for {county['name']} County")
+        if skip_ids:
+            return [obs for obs in self.test_observations if obs['id'] not in skip_ids]
         return self.test_observations
 
 def setup_test_environment():
@@ -124,7 +132,8 @@ def run_initial_detection_test():
     
     # Get new alerts (should include all initial observations)
     new_alerts = fetcher.get_new_alerts(county)
-    
+    fetcher.flush()
+
     # Verify results
     print(f"\nRESULTS: Found {len(new_alerts)} new observations")
     for alert in new_alerts:
@@ -132,8 +141,9 @@ def run_initial_detection_test():
     
     # Verify the storage file was created
     if os.path.exists(TEST_STORAGE_FILE):
-        with open(TEST_STORAGE_FILE, 'r') as f:
-            stored_data = json.load(f)
+        with open(TEST_STORAGE_FILE, 'rb') as f:
+            data = f.read()
+        stored_data = orjson.loads(data) if orjson else json.loads(data)
         print(f"Storage file created with {len(stored_data.get(county['alert_id'], []))} tracked observation IDs")
     
     return fetcher
@@ -158,28 +168,30 @@ def run_new_observation_test(fetcher):
     
     # Get new alerts (should only include NEW_OBSERVATIONS)
     new_alerts = fetcher.get_new_alerts(county)
-    
+    fetcher.flush()
+
     # Verify results
     print(f"\nRESULTS: Detected {len(new_alerts)} new observations")
     for alert in new_alerts:
         print(f"  - {alert['species']} (ID: {alert['id']})")
     
     # Verify the IDs of the newly detected observations match NEW_OBSERVATIONS
-    new_ids = [alert['id'] for alert in new_alerts]
-    expected_ids = [obs['id'] for obs in NEW_OBSERVATIONS]
-    
-    missing_ids = [id for id in expected_ids if id not in new_ids]
-    extra_ids = [id for id in new_ids if id not in expected_ids]
-    
+    # using set difference - linear rather than quadratic in fixture size
+    new_ids = {alert['id'] for alert in new_alerts}
+    expected_ids = {obs['id'] for obs in NEW_OBSERVATIONS}
+
+    missing_ids = expected_ids - new_ids
+    extra_ids = new_ids - expected_ids
+
     if len(missing_ids) == 0 and len(extra_ids) == 0:
         print("\nSUCCESS: Correctly identified only the new observations!")
     else:
         print("\nTEST FAILED: Detection issues found")
         if missing_ids:
-            print(f"Missing expected IDs: {missing_ids}")
+            print(f"Missing expected IDs: {sorted(missing_ids)}")
         if extra_ids:
-            print(f"Unexpected extra IDs: {extra_ids}")
-    
+            print(f"Unexpected extra IDs: {sorted(extra_ids)}")
+
     return len(missing_ids) == 0 and len(extra_ids) == 0
 
 def run_no_new_observations_test(fetcher):
@@ -200,7 +212,8 @@ def run_no_new_observations_test(fetcher):
     
     # Get new alerts (should be empty)
     new_alerts = fetcher.get_new_alerts(county)
-    
+    fetcher.flush()
+
     # Verify results
     print(f"\nRESULTS: Detected {len(new_alerts)} new observations")
     